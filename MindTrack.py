@@ -2,15 +2,65 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 from pathlib import Path
 import datetime
+import functools
+from array import array
+import os
 import shutil
+import time
+import atexit
 import csv
+import gzip
+import mmap
 import calendar
+import re
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
 
 # ---------------- Constants ----------------
 JOURNAL_FILE = Path("learning_journal.txt")
 BACKUP_FOLDER = Path("journal_backups")
 SEPARATOR = "-" * 50
 DATE_FORMAT = "%Y-%m-%d — %I:%M %p"
+# Appends only take a backup once this many writes or seconds have passed
+BACKUP_EVERY_WRITES = 10
+BACKUP_EVERY_SECONDS = 60
+FICLONE = 0x40049409  # Linux ioctl: share the source file's extents (reflink)
+
+# One entry block: optional "🗓️ <datetime>" line, free text, optional
+# trailing "Productivity Rating: N/5" line. Only the last line is matched
+# against this; the text itself is never run through a pattern with .*
+_RATING_LINE_RE = re.compile(r"productivity rating:[ \t]*(\d+)/5", re.IGNORECASE)
+# a date or rating line left in the text means a hand-edited block the fast
+# path doesn't cover, e.g. "Productivity Rating: 4 /5" or a second date
+# (searching for "\n" is several times faster than a MULTILINE "^"; the
+# text's first line is checked with _MARKER_START_RE)
+_MARKER_LINE_RE = re.compile(r"\n(?:🗓️|productivity rating)", re.IGNORECASE)
+_MARKER_START_RE = re.compile(r"🗓️|productivity rating", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"\w+")
+# characters that make csv.writer quote a field
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+
+# Process-lifetime cache of the journal contents. "mtime", "size" and "ino"
+# describe the file the cache was built from (mtime None means not loaded /
+# invalidated); "size" is also the byte offset the next tail read starts at
+# and "crc" the zlib.crc32 of those first "size" bytes. "ratings" holds one
+# signed byte per entry (-1 = no rating) so statistics never touch the dicts.
+# "index" is the search index (token -> set of entry indices) and "by_date"
+# maps datetime.date -> list of entry indices; both are built lazily.
+_ENTRY_CACHE = {"mtime": None, "size": 0, "ino": None, "crc": 0,
+                "blocks": None, "parsed": None, "ratings": None, "index": None,
+                "by_date": None}
+
+# O_APPEND file descriptor kept open between saves, and backup throttling state.
+_journal_fd = None
+_last_backup_time = None
+_writes_since_backup = 0
 
 # ---------------- Utilities ----------------
 
@@ -19,118 +69,620 @@ def ensure_backup_folder():
     BACKUP_FOLDER.mkdir(exist_ok=True)
 
 
-def create_backup():
+def _reflink(src, dst):
+    """Clone src into dst on copy-on-write filesystems; False if unsupported."""
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        return True
+    except OSError:
+        return False
+
+
+def create_backup(before_rewrite=False):
+    """Snapshot the journal into BACKUP_FOLDER.
+
+    Pass before_rewrite=True only when the journal is about to be replaced
+    or removed (never appended to): the snapshot can then be a hardlink to
+    the old file. Otherwise a reflink is tried, falling back to a copy.
+    Returns the backup path, or None if there was no journal to back up.
+    """
     if not JOURNAL_FILE.exists():
-        return
+        return None
     ensure_backup_folder()
     stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_name = BACKUP_FOLDER / f"backup_{stamp}.txt"
-    shutil.copy(JOURNAL_FILE, backup_name)
+    if backup_name.exists():
+        backup_name.unlink()
+    linked = False
+    if before_rewrite:
+        try:
+            os.link(JOURNAL_FILE, backup_name)
+            linked = True
+        except OSError:
+            pass
+    if not linked and not _reflink(JOURNAL_FILE, backup_name):
+        shutil.copy(JOURNAL_FILE, backup_name)
+    global _last_backup_time, _writes_since_backup
+    _last_backup_time = time.monotonic()
+    _writes_since_backup = 0
+    return backup_name
+
+
+def _maybe_backup():
+    """Back up before an append only when the backup policy says it's due."""
+    global _writes_since_backup
+    due = (_last_backup_time is None
+           or _writes_since_backup >= BACKUP_EVERY_WRITES
+           or time.monotonic() - _last_backup_time >= BACKUP_EVERY_SECONDS)
+    if due:
+        create_backup()
+    _writes_since_backup += 1
+
+
+def _get_journal_fd():
+    global _journal_fd
+    if _journal_fd is not None:
+        # reopen if the file was removed or replaced behind our back
+        try:
+            if os.fstat(_journal_fd).st_ino == JOURNAL_FILE.stat().st_ino:
+                return _journal_fd
+        except FileNotFoundError:
+            pass
+        close_journal_fd()
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    _journal_fd = os.open(JOURNAL_FILE, flags, 0o644)
+    return _journal_fd
+
+
+def close_journal_fd():
+    """Close the append descriptor; call before the journal file is rewritten or removed."""
+    global _journal_fd
+    if _journal_fd is not None:
+        os.close(_journal_fd)
+        _journal_fd = None
+
+
+atexit.register(close_journal_fd)
+
+
+def _journal_stat():
+    """Return (st_mtime_ns, st_size, st_ino) of the journal, or (-1, 0, None) if missing."""
+    try:
+        st = JOURNAL_FILE.stat()
+    except FileNotFoundError:
+        return -1, 0, None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _cache_is_fresh(stat=None):
+    # mtime alone can miss a write (coarse timestamps, os.utime), so size and inode count too
+    return (_ENTRY_CACHE["blocks"] is not None
+            and (_ENTRY_CACHE["mtime"], _ENTRY_CACHE["size"], _ENTRY_CACHE["ino"])
+            == (stat or _journal_stat()))
+
+
+def _mark_cache_synced(crc, stat=None):
+    """Record that the cached blocks now match the journal on disk."""
+    _ENTRY_CACHE["mtime"], _ENTRY_CACHE["size"], _ENTRY_CACHE["ino"] = (
+        stat or _journal_stat())
+    _ENTRY_CACHE["crc"] = crc
+
+
+def invalidate_entry_cache():
+    _ENTRY_CACHE["mtime"] = None
+    _ENTRY_CACHE["size"] = 0
+    _ENTRY_CACHE["ino"] = None
+    _ENTRY_CACHE["crc"] = 0
+    _ENTRY_CACHE["blocks"] = None
+    _ENTRY_CACHE["parsed"] = None
+    _ENTRY_CACHE["ratings"] = None
+    _ENTRY_CACHE["index"] = None
+    _ENTRY_CACHE["by_date"] = None
+
+
+def _ratings_array(parsed):
+    # hand-edited out-of-range ratings don't fit a signed byte; leave them out
+    return array("b", [p["rating"] if p["rating"] is not None and p["rating"] < 128 else -1
+                       for p in parsed])
+
+
+def _cache_reset(blocks, parsed):
+    _ENTRY_CACHE["blocks"] = blocks
+    _ENTRY_CACHE["parsed"] = parsed
+    _ENTRY_CACHE["ratings"] = _ratings_array(parsed)
+    _ENTRY_CACHE["index"] = None
+    _ENTRY_CACHE["by_date"] = None
+
+
+def _cache_splice(start, stop, new_blocks, new_parsed):
+    """Replace cached entries [start:stop] with new ones, keeping all per-entry lists in step."""
+    appending = start == stop == len(_ENTRY_CACHE["blocks"])
+    _ENTRY_CACHE["blocks"][start:stop] = new_blocks
+    _ENTRY_CACHE["parsed"][start:stop] = new_parsed
+    _ENTRY_CACHE["ratings"][start:stop] = _ratings_array(new_parsed)
+    if _ENTRY_CACHE["index"] is not None:
+        if appending:
+            _index_blocks(_ENTRY_CACHE["index"], new_blocks, start)
+        else:
+            # later indices shifted; rebuild on the next search
+            _ENTRY_CACHE["index"] = None
+    if _ENTRY_CACHE["by_date"] is not None:
+        if appending:
+            _index_dates(_ENTRY_CACHE["by_date"], new_parsed, start)
+        else:
+            _ENTRY_CACHE["by_date"] = None
+
+
+def _index_blocks(index, blocks, start):
+    for i, b in enumerate(blocks, start):
+        for tok in set(_TOKEN_RE.findall(b.lower())):
+            index[tok].add(i)
+
 
+def _get_search_index():
+    cache = _load_entries()
+    if cache["index"] is None:
+        cache["index"] = defaultdict(set)
+        _index_blocks(cache["index"], cache["blocks"], 0)
+    return cache["index"]
 
-def append_entry_to_file(entry_text, rating):
-    create_backup()
+
+def format_entry_datetime(now):
+    """Format a datetime as DATE_FORMAT without strftime, so AM/PM never depends on the locale."""
+    return (f"{now.year:04d}-{now.month:02d}-{now.day:02d} — "
+            f"{(now.hour - 1) % 12 + 1:02d}:{now.minute:02d} {'AM' if now.hour < 12 else 'PM'}")
+
+
+def parse_entry_datetime(dt):
+    """Turn a DATE_FORMAT string ("2024-05-01 — 09:30 PM") into a datetime, or None.
+
+    The format is fixed-width, so it is sliced instead of going through strptime;
+    strptime is only the fallback for locales that don't write AM/PM.
+    """
+    if not dt:
+        return None
+    if (len(dt) == 21 and dt[4] == "-" and dt[7] == "-" and dt[10:13] == " — "
+            and dt[15] == ":" and dt[18] == " " and dt[19:21] in ("AM", "PM")):
+        try:
+            hour = int(dt[13:15]) % 12 + (12 if dt[19:21] == "PM" else 0)
+            return datetime.datetime(int(dt[0:4]), int(dt[5:7]), int(dt[8:10]),
+                                     hour, int(dt[16:18]))
+        except ValueError:
+            return None
+    try:
+        return datetime.datetime.strptime(dt, DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def _entry_date(dt):
+    """The date part of a DATE_FORMAT string, or None."""
+    # only the leading YYYY-MM-DD matters here, so skip building the time of day
+    if dt and len(dt) >= 10 and dt[4] == "-" and dt[7] == "-":
+        try:
+            return datetime.date.fromisoformat(dt[:10])
+        except ValueError:
+            pass
+    when = parse_entry_datetime(dt)
+    return when.date() if when is not None else None
+
+
+def _index_dates(by_date, parsed, start):
+    for i, p in enumerate(parsed, start):
+        if p["date"] is not None:
+            by_date[p["date"]].append(i)
+
+
+def _date_index(cache):
+    if cache["by_date"] is None:
+        cache["by_date"] = defaultdict(list)
+        _index_dates(cache["by_date"], cache["parsed"], 0)
+    return cache["by_date"]
+
+
+def get_entries_by_date():
+    """Return {datetime.date: [entry indices]} for all dated entries (cached; do not mutate)."""
+    return _date_index(_load_entries())
+
+
+def get_entries_on(day):
+    """Return the parsed entries dated day (a datetime.date), in file order."""
+    cache = _load_entries()
+    parsed = cache["parsed"]
+    return [parsed[i] for i in _date_index(cache).get(day, ())]
+
+
+_CALENDAR = calendar.Calendar(firstweekday=0)
+# calendar.month_name formats the name on every lookup; do it once
+_MONTH_NAMES = tuple(calendar.month_name)
+_WEEKDAYS = ("Mo", "Tu", "We", "Th", "Fr", "Sa", "Su")
+# calendar cell captions by day of month; days with entries get an asterisk
+_DAY_LABELS = tuple(str(d) for d in range(32))
+_MARKED_DAY_LABELS = tuple(f"{d}*" for d in range(32))
+
+
+@functools.lru_cache(maxsize=256)
+def month_dates(year, month):
+    """All dates of the whole weeks (Mon-Sun) covering year/month, as a tuple."""
+    return tuple(_CALENDAR.itermonthdates(year, month))
+
+
+def search_entries(query):
+    """Return indices (in file order) of entries containing query, ignoring case."""
+    q = query.lower()
+    blocks = _load_entries()["blocks"]
+    q_tokens = set(_TOKEN_RE.findall(q))
+    if not q_tokens:
+        return [i for i, b in enumerate(blocks) if q in b.lower()]
+    index = _get_search_index()
+    candidates = None
+    for qt in q_tokens:
+        # a query word can match inside a longer word ("learn" in "learning")
+        ids = set().union(*(tok_ids for tok, tok_ids in index.items() if qt in tok))
+        candidates = ids if candidates is None else candidates & ids
+        if not candidates:
+            return []
+    if q_tokens == {q}:
+        return sorted(candidates)
+    # multi-word / punctuated query: confirm the exact phrase on the candidates
+    return [i for i in sorted(candidates) if q in blocks[i].lower()]
+
+
+def _decode_journal(data):
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _parse_mapped(mm):
+    """parse_all() for a mapped journal file: split the bytes and decode block by block,
+    so the whole file never exists as one decoded str."""
+    sep = SEPARATOR.encode()
+    blocks = []
+    parsed = []
+    pos = 0
+    end = len(mm)
+    while pos <= end:
+        stop = mm.find(sep, pos)
+        if stop < 0:
+            stop = end
+        b = _decode_journal(mm[pos:stop]).strip()
+        if b:
+            blocks.append(b)
+            parsed.append(parse_entry(b))
+        pos = stop + len(sep)
+    return blocks, parsed
+
+
+def _ends_on_separator(tail):
+    """True if tail, the last bytes of the journal, finishes with a separator line."""
+    return tail.endswith(b"\n") and tail.rstrip(b"\r\n").endswith(SEPARATOR.encode())
+
+
+def _journal_tail_gap():
+    """What has to be written before a new entry so that it starts a block of its own:
+    "" normally, a separator line if the file's last entry was never closed off."""
+    try:
+        with open(JOURNAL_FILE, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            if not size:
+                return ""
+            f.seek(max(0, size - len(SEPARATOR) - 2))
+            tail = f.read()
+    except FileNotFoundError:
+        return ""
+    if _ends_on_separator(tail):
+        return ""
+    return ("" if tail.endswith(b"\n") else "\n") + SEPARATOR + "\n"
+
+
+def _read_appended_tail(stat):
+    """Return (text, crc, size) for what was appended since the cache was built,
+    or None if the file changed in any other way and has to be re-read in full."""
+    offset = _ENTRY_CACHE["size"]
+    _, size, ino = stat
+    if (_ENTRY_CACHE["blocks"] is None or ino is None
+            or ino != _ENTRY_CACHE["ino"] or size <= offset):
+        return None
+    # map the file instead of reading it, so checking the cached part never
+    # copies it into a bytes object
+    with open(JOURNAL_FILE, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) <= offset:
+            return None
+        # the cached part must be unchanged and end with a separator line;
+        # hashing it is far cheaper than decoding and re-parsing it
+        with memoryview(mm) as view:
+            crc = zlib.crc32(view[:offset])
+        if crc != _ENTRY_CACHE["crc"]:
+            return None
+        if offset and not _ends_on_separator(
+                mm[max(0, offset - len(SEPARATOR) - 2):offset]):
+            return None
+        tail = mm[offset:]
+    return (_decode_journal(tail), zlib.crc32(tail, crc), offset + len(tail))
+
+
+def _load_entries():
+    """Make sure the cache matches the file on disk and return it."""
+    stat = _journal_stat()
+    if _cache_is_fresh(stat):
+        return _ENTRY_CACHE
+    appended = _read_appended_tail(stat)
+    if appended is None:
+        stat, crc, entries = read_journal_snapshot()
+        _cache_reset(*entries)
+        _mark_cache_synced(crc, stat)
+        return _ENTRY_CACHE
+    # only new entries were appended: parse just those
+    tail, crc, size = appended
+    end = len(_ENTRY_CACHE["blocks"])
+    _cache_splice(end, end, *parse_all(tail))
+    # use the byte count actually read, in case the file grew meanwhile
+    _mark_cache_synced(crc, (stat[0], size, stat[2]))
+    return _ENTRY_CACHE
+
+
+def read_journal_snapshot():
+    """Read and parse the whole journal without touching the cache.
+
+    Safe to call from a worker thread; hand the result to
+    install_journal_snapshot() on the Tk thread.
+    """
+    stat = _journal_stat()
+    if stat[2] is None or stat[1] == 0:
+        return (stat, 0, ([], []))
+    with open(JOURNAL_FILE, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            crc = zlib.crc32(view)
+        entries = _parse_mapped(mm)
+        # use the byte count actually mapped, in case the file grew meanwhile
+        return (stat[0], len(mm), stat[2]), crc, entries
+
+
+def install_journal_snapshot(snapshot):
+    """Load a read_journal_snapshot() result into the cache, unless the file changed since."""
+    stat, crc, (blocks, parsed) = snapshot
+    if _cache_is_fresh() or _journal_stat() != stat:
+        return
+    _cache_reset(blocks, parsed)
+    _mark_cache_synced(crc, stat)
+
+
+def entries_are_cached():
+    """True if reading the entries would not touch the disk."""
+    return _cache_is_fresh()
+
+
+def append_entry_to_file(entry_text, rating, durable=False):
+    """Append an entry. Pass durable=True to also flush it to disk before returning."""
+    _maybe_backup()
     now = datetime.datetime.now()
-    date_str = now.strftime(DATE_FORMAT)
+    date_str = format_entry_datetime(now)
     parts = [f"🗓️ {date_str}", entry_text]
     if rating:
         parts.append(f"Productivity Rating: {rating}/5")
     entry_block = "\n".join(parts) + "\n" + SEPARATOR + "\n"
-    JOURNAL_FILE.open("a", encoding="utf-8").write(entry_block)
+    # older journals can end without a final separator; close that entry off
+    # first, or the new one would merge into it
+    entry_block = _journal_tail_gap() + entry_block
+    data = entry_block.encode("utf-8")
+    cache_fresh = _cache_is_fresh()
+    fd = _get_journal_fd()
+    # O_APPEND: each write lands at the current end of file, even with other writers
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    if durable:
+        getattr(os, "fdatasync", os.fsync)(fd)
+    stat = _journal_stat()
+    if cache_fresh and stat[1] == _ENTRY_CACHE["size"] + len(data):
+        # update the cache in place instead of re-reading the whole file
+        end = len(_ENTRY_CACHE["blocks"])
+        _cache_splice(end, end, *parse_all(entry_block))
+        _mark_cache_synced(zlib.crc32(data, _ENTRY_CACHE["crc"]), stat)
+    else:
+        invalidate_entry_cache()
+
+
+def parse_all(content):
+    """Split journal text into blocks and parse them; returns (blocks, parsed)."""
+    blocks = []
+    parsed = []
+    for b in content.split(SEPARATOR):
+        b = b.strip()
+        if b:
+            blocks.append(b)
+            parsed.append(parse_entry(b))
+    return blocks, parsed
 
 
 def read_all_entries_raw():
-    if not JOURNAL_FILE.exists():
-        return []
-    content = JOURNAL_FILE.read_text(encoding="utf-8").strip()
-    if not content:
-        return []
-    blocks = [b.strip() for b in content.split(SEPARATOR) if b.strip()]
-    return blocks
+    """Return the list of raw entry blocks (cached; do not mutate)."""
+    return _load_entries()["blocks"]
+
+
+def read_all_entries_parsed():
+    """Return parse_entry() of every block, in file order (cached; do not mutate)."""
+    return _load_entries()["parsed"]
 
 
 def parse_entry(block):
     """
-    Parse a block and return dict: {'datetime':..., 'text':..., 'rating': int|None, 'raw': ...}
+    Parse a block and return dict: {'datetime':..., 'text':..., 'rating': int|None, 'raw': ...,
+    'date': datetime.date|None}
     This relies on the format we write entries in.
     """
-    lines = [l.rstrip() for l in block.splitlines() if l.strip()]
+    dt, text, rating, date = _parse_entry_cached(block.strip())
+    return {"datetime": dt, "text": text, "rating": rating, "raw": block, "date": date}
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_entry_cached(block):
+    """Memoized core of parse_entry(): stripped block -> (datetime, text, rating, date).
+
+    Parsing only depends on the block text, so unchanged blocks are never
+    re-parsed, e.g. when the journal is re-read after an external edit.
+    """
+    dt = None
+    text = block
+    if block.startswith("🗓️"):
+        head, _, text = block.partition("\n")
+        dt = head[len("🗓️"):].strip() or None
+    rest, _, last = text.rpartition("\n")
+    m = _RATING_LINE_RE.fullmatch(last)
+    rating = None
+    if m:
+        rating = int(m.group(1))
+        text = rest
+    if text and (_MARKER_START_RE.match(text) or _MARKER_LINE_RE.search(text)):
+        dt, text, rating = _parse_entry_lines(block)
+    else:
+        text = text.strip()
+    return dt, text, rating, _entry_date(dt)
+
+
+def _parse_entry_lines(block):
+    """Line-by-line fallback for blocks the fast path can't take apart: every date line
+    and every "Productivity Rating" line counts, the last one wins."""
     dt = None
     rating = None
     text_lines = []
-    for i, line in enumerate(lines):
+    for line in block.split("\n"):
         if line.startswith("🗓️"):
-            dt = line.replace("🗓️", "").strip()
+            dt = line.replace("🗓️", "").strip() or None
         elif line.lower().startswith("productivity rating"):
             # extract rating like 'Productivity Rating: 4/5'
             try:
                 rating = int(line.split(":")[1].strip().split("/")[0])
-            except Exception:
+            except (IndexError, ValueError):
                 rating = None
         else:
-            # treat as content
             text_lines.append(line)
-    text = "\n".join(text_lines).strip()
-    return {"datetime": dt, "text": text, "rating": rating, "raw": block}
+    return dt, "\n".join(text_lines).strip(), rating
+
+
+def count_entries():
+    return len(_load_entries()["blocks"])
+
+
+def average_rating():
+    """Mean of the rated entries, rounded to 2 places, or None if none are rated."""
+    ratings = _load_entries()["ratings"]
+    unrated = ratings.count(-1)
+    rated = len(ratings) - unrated
+    # each unrated entry contributes -1 to the sum
+    return round((sum(ratings) + unrated) / rated, 2) if rated else None
+
+
+def recent_parsed(n):
+    """The last n entries, newest first."""
+    # assume file append order is chronological; last entries are newest
+    return _load_entries()["parsed"][-n:][::-1] if n > 0 else []
 
 
 def get_statistics():
-    entries = read_all_entries_raw()
-    parsed = [parse_entry(e) for e in entries]
-    total = len(parsed)
-    ratings = [p["rating"] for p in parsed if isinstance(p["rating"], int)]
-    avg_rating = round(sum(ratings) / len(ratings), 2) if ratings else None
-    # Most recent: assume file append order is chronological; last entries are newest
-    recent = parsed[-3:][::-1]  # newest first (max 3)
-    return {"total": total, "avg_rating": avg_rating, "recent": recent, "parsed_all": parsed}
-
-
-def export_to_csv(path):
-    stats = get_statistics()
-    parsed = stats["parsed_all"]
+    return {"total": count_entries(), "avg_rating": average_rating(),
+            "recent": recent_parsed(3)}
+
+
+def export_to_csv(path, parsed=None):
+    """Write entries to a CSV file. Pass a snapshot of the parsed entries
+    when calling from a worker thread, so the cache is only read on the Tk thread."""
+    if parsed is None:
+        parsed = read_all_entries_parsed()
     if not parsed:
         raise ValueError("No entries to export.")
-    with open(path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["Timestamp", "Entry", "Rating"])
-        for p in parsed:
-            writer.writerow(
-                [p["datetime"] or "", p["text"], p["rating"] or ""])
+    rows = [(p["datetime"] or "", p["text"], p["rating"] or "") for p in parsed]
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "wt", newline="", encoding="utf-8") as csvfile:
+        if any(_CSV_SPECIAL.search(r[0]) or _CSV_SPECIAL.search(r[1]) for r in rows):
+            writer = csv.writer(csvfile)
+            writer.writerow(["Timestamp", "Entry", "Rating"])
+            writer.writerows(rows)
+        else:
+            # nothing needs quoting: build the same output as csv.writer in one write
+            lines = ["Timestamp,Entry,Rating\r\n"]
+            lines.extend("%s,%s,%s\r\n" % r for r in rows)
+            csvfile.write("".join(lines))
     return path
 
 
 # file-modification helpers
-def replace_block_in_file(old_block, new_block):
-    """Replace the exact old_block with new_block in the journal file."""
+def _find_block_index(blocks, old_block, idx=None):
+    """Return the position of old_block, trusting idx when it still matches."""
+    old = old_block.strip()
+    if idx is not None and 0 <= idx < len(blocks) and blocks[idx] == old:
+        return idx
+    try:
+        return blocks.index(old)
+    except ValueError:
+        raise ValueError("Original entry not found in file.") from None
+
+
+def _rewrite_journal(start, stop, new_blocks, new_parsed):
+    """Back up the journal, rewrite it with cached entries [start:stop] replaced,
+    then update the cache."""
+    blocks = _ENTRY_CACHE["blocks"]
+    data = "".join(b + "\n" + SEPARATOR + "\n"
+                   for b in blocks[:start] + new_blocks + blocks[stop:]).encode("utf-8")
+    close_journal_fd()
+    # write a new file and swap it in, so hardlinked backups keep the old one
+    tmp = JOURNAL_FILE.with_suffix(".tmp")
+    try:
+        tmp.write_bytes(data)
+        # the new file is built from the cache; never let it replace entries
+        # that were written to the journal after the cache was checked
+        if not _cache_is_fresh():
+            raise RuntimeError("The journal changed on disk. Please try again.")
+        # link the backup only right before the swap: until then it shares the
+        # journal's inode and would follow any later append
+        backup = create_backup(before_rewrite=True)
+        try:
+            os.replace(tmp, JOURNAL_FILE)
+        except OSError:
+            if backup is not None:
+                backup.unlink(missing_ok=True)
+            raise
+    finally:
+        tmp.unlink(missing_ok=True)
+    _cache_splice(start, stop, new_blocks, new_parsed)
+    _mark_cache_synced(zlib.crc32(data))
+
+
+def replace_block_in_file(old_block, new_block, idx=None):
+    """Replace old_block (at position idx, if known) with new_block in the journal file."""
     if not JOURNAL_FILE.exists():
         raise FileNotFoundError("Journal file not found.")
-    content = JOURNAL_FILE.read_text(encoding="utf-8")
-    if old_block.strip() not in content:
-        raise ValueError("Original entry not found in file.")
-    create_backup()
-    content = content.replace(old_block.strip(), new_block.strip())
-    JOURNAL_FILE.write_text(content.strip() + "\n", encoding="utf-8")
+    idx = _find_block_index(_load_entries()["blocks"], old_block, idx)
+    _rewrite_journal(idx, idx + 1, *parse_all(new_block))
 
 
-def delete_block_from_file(old_block):
+def delete_block_from_file(old_block, idx=None):
     if not JOURNAL_FILE.exists():
         return
-    content = JOURNAL_FILE.read_text(encoding="utf-8")
-    create_backup()
-    content = content.replace(old_block.strip(), "")
-    # Clean up extra separators and whitespace
-    new = "\n".join([l for l in [s.strip()
-                    for s in content.split(SEPARATOR)] if l])
-    if new:
-        JOURNAL_FILE.write_text(new.strip() + "\n", encoding="utf-8")
-    else:
-        JOURNAL_FILE.write_text("", encoding="utf-8")
+    idx = _find_block_index(_load_entries()["blocks"], old_block, idx)
+    _rewrite_journal(idx, idx + 1, [], [])
 
 
 def clear_all_entries():
     if JOURNAL_FILE.exists():
-        create_backup()
-        JOURNAL_FILE.unlink()
+        close_journal_fd()
+        backup = create_backup(before_rewrite=True)
+        try:
+            JOURNAL_FILE.unlink()
+        except OSError:
+            # the link would otherwise keep tracking the live journal
+            if backup is not None:
+                backup.unlink(missing_ok=True)
+            raise
+    invalidate_entry_cache()
+    _parse_entry_cached.cache_clear()
 
 
 # ---------------- GUI Application ----------------
@@ -145,6 +697,8 @@ class JournalApp(tk.Tk):
         self.style = ttk.Style(self)
         # in-memory theme, default dark
         self.dark_mode = True
+        # background work (CSV export) so the UI doesn't freeze
+        self.executor = ThreadPoolExecutor(max_workers=2)
         self.configure_ui()
         self.create_widgets()
         self.refresh_dashboard()
@@ -163,13 +717,35 @@ class JournalApp(tk.Tk):
             "fg": "#e6eef8",
             "accent": "#5aa9ff"
         }
+        # build each palette into its own ttk theme once; toggling only switches themes
+        self.register_theme("mindtrack_light", self.light_colors)
+        self.register_theme("mindtrack_dark", self.dark_colors)
         self.apply_theme()
 
-    def apply_theme(self):
-        c = self.dark_colors if self.dark_mode else self.light_colors
-        self.configure(bg=c["bg"])
-        # ttk styling for frames, buttons, labels
+    def register_theme(self, name, c):
+        if name in self.style.theme_names():
+            return
+        # A child theme only inherits clam's elements and layouts, not its
+        # style options, so copy those over at the Tcl level first.
         self.style.theme_use("clam")
+        try:
+            styles = self.tk.splitlist(
+                self.tk.call("ttk::style", "theme", "styles", "clam"))
+        except tk.TclError:  # Tk < 8.6.10
+            styles = (".", "TButton", "Toolbutton", "TCheckbutton", "TRadiobutton",
+                      "TMenubutton", "TEntry", "TCombobox", "TSpinbox", "TNotebook.Tab",
+                      "TLabelframe", "TProgressbar", "TScrollbar", "Sash", "Treeview",
+                      "Heading")
+        clam = [(st, self.tk.call("ttk::style", "configure", st),
+                 self.tk.call("ttk::style", "map", st)) for st in styles]
+        self.style.theme_create(name, parent="clam")
+        self.style.theme_use(name)
+        for st, options, state_map in clam:
+            if options:
+                self.tk.call("ttk::style", "configure", st, *options)
+            if state_map:
+                self.tk.call("ttk::style", "map", st, *state_map)
+        # ttk styling for frames, buttons, labels
         self.style.configure("TFrame", background=c["bg"])
         self.style.configure("Panel.TFrame", background=c["panel"])
         self.style.configure(
@@ -182,6 +758,11 @@ class JournalApp(tk.Tk):
         self.style.configure(
             "TButton", background=c["panel"], foreground=c["fg"])
 
+    def apply_theme(self):
+        c = self.dark_colors if self.dark_mode else self.light_colors
+        self.configure(bg=c["bg"])
+        self.style.theme_use("mindtrack_dark" if self.dark_mode else "mindtrack_light")
+
     def create_widgets(self):
         c = self.dark_colors if self.dark_mode else self.light_colors
 
@@ -276,14 +857,28 @@ class JournalApp(tk.Tk):
         try:
             default = f"learning_journal_export_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             path = filedialog.asksaveasfilename(defaultextension=".csv", initialfile=default,
-                                                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+                                                filetypes=[("CSV files", "*.csv"), ("Gzipped CSV files", "*.csv.gz"),
+                                                           ("All files", "*.*")])
             if not path:
                 return
-            export_to_csv(path)
-            messagebox.showinfo("Exported", f"Exported entries to:\n{path}")
+            # snapshot on the Tk thread; the worker only writes the file
+            parsed = list(read_all_entries_parsed())
+            future = self.executor.submit(export_to_csv, path, parsed)
+            self.after(50, self._poll_export, future, path)
         except Exception as e:
             messagebox.showerror("Export failed", str(e))
 
+    def _poll_export(self, future, path):
+        # Tk calls must stay on the main thread, so poll instead of using a callback
+        if not future.done():
+            self.after(50, self._poll_export, future, path)
+            return
+        e = future.exception()
+        if e is not None:
+            messagebox.showerror("Export failed", str(e))
+        else:
+            messagebox.showinfo("Exported", f"Exported entries to:\n{path}")
+
     def gui_clear_all(self):
         if messagebox.askyesno("Confirm Clear", "Are you sure you want to delete ALL entries? This action cannot be undone."):
             try:
@@ -329,12 +924,13 @@ class DashboardFrame(ttk.Frame):
         stats_frame = ttk.Frame(self, style="Panel.TFrame")
         stats_frame.pack(fill="x", padx=pad, pady=(6, 12))
 
-        self.total_var = tk.StringVar(value="Total entries : 0")
-        self.avg_var = tk.StringVar(value="Average rating : ")
-        ttk.Label(stats_frame, textvariable=self.total_var, font=(
-            "Segoe UI", 12)).pack(anchor="w", padx=10, pady=6)
-        ttk.Label(stats_frame, textvariable=self.avg_var, font=(
-            "Segoe UI", 12)).pack(anchor="w", padx=10, pady=6)
+        # plain labels updated with configure(); no Tcl variable needed
+        self.total_lbl = ttk.Label(stats_frame, text="Total entries : 0", font=(
+            "Segoe UI", 12))
+        self.total_lbl.pack(anchor="w", padx=10, pady=6)
+        self.avg_lbl = ttk.Label(stats_frame, text="Average rating : ", font=(
+            "Segoe UI", 12))
+        self.avg_lbl.pack(anchor="w", padx=10, pady=6)
 
         # Recent entries panel
         recent_label = ttk.Label(
@@ -357,9 +953,10 @@ class DashboardFrame(ttk.Frame):
 
     def refresh(self):
         stats = get_statistics()
-        self.total_var.set(f"Total entries : {stats['total']}")
+        self.total_lbl.configure(text=f"Total entries : {stats['total']}")
         avg = stats["avg_rating"]
-        self.avg_var.set(f"Average rating : {avg if avg is not None else ''}")
+        self.avg_lbl.configure(
+            text=f"Average rating : {avg if avg is not None else ''}")
         # recent entries text
         self.recent_box.configure(state=tk.NORMAL)
         self.recent_box.delete("1.0", tk.END)
@@ -401,15 +998,14 @@ class AddEntryFrame(ttk.Frame):
         bottom.pack(fill="x", padx=pad, pady=6)
         ttk.Label(
             bottom, text="Productivity Rating (1-5, optional):").pack(side="left")
-        self.rating_var = tk.StringVar()
-        ttk.Entry(bottom, textvariable=self.rating_var,
-                  width=6).pack(side="left", padx=(8, 0))
+        self.rating_entry = ttk.Entry(bottom, width=6)
+        self.rating_entry.pack(side="left", padx=(8, 0))
         ttk.Button(bottom, text="Save Entry", command=self.save_entry).pack(
             side="right", padx=6)
 
     def save_entry(self):
         text = self.entry_box.get("1.0", tk.END).strip()
-        rating = self.rating_var.get().strip()
+        rating = self.rating_entry.get().strip()
         if not text:
             messagebox.showerror(
                 "Missing text", "Please write what you learned.")
@@ -426,18 +1022,128 @@ class AddEntryFrame(ttk.Frame):
             append_entry_to_file(text, rating_val)
             messagebox.showinfo("Saved", "Your entry was saved successfully.")
             self.entry_box.delete("1.0", tk.END)
-            self.rating_var.set("")
+            self.rating_entry.delete(0, tk.END)
             self.controller.refresh_dashboard()
         except Exception as e:
             messagebox.showerror("Save failed", str(e))
 
 
+class EntryRow(ttk.Frame):
+    """One entry with its date, text and rating, and Edit/Update/Delete buttons.
+
+    on_updated(row) / on_deleted(row) are called after the journal was changed.
+    """
+
+    def __init__(self, parent, on_updated, on_deleted, text_height=5):
+        super().__init__(parent, style="Panel.TFrame", padding=8)
+        self.idx = None
+        self.block = None
+        self.on_updated = on_updated
+        self.on_deleted = on_deleted
+
+        top = ttk.Frame(self)
+        top.pack(fill="x")
+        self.dt_label = ttk.Label(top, text="", font=("Segoe UI", 10, "bold"))
+        self.dt_label.pack(side="left")
+
+        btns = ttk.Frame(top)
+        btns.pack(side="right")
+        self.edit_btn = ttk.Button(btns, text="Edit", command=self.on_edit)
+        self.update_btn = ttk.Button(btns, text="Update", command=self.on_update)
+        self.del_btn = ttk.Button(btns, text="Delete", command=self.on_delete)
+        self.edit_btn.pack(side="left", padx=4)
+        self.update_btn.pack(side="left", padx=4)
+        self.del_btn.pack(side="left", padx=4)
+
+        self.text_widget = scrolledtext.ScrolledText(
+            self, height=text_height, wrap=tk.WORD)
+        self.text_widget.pack(fill="both", padx=(0, 0), pady=(6, 6))
+
+        rating_frame = ttk.Frame(self)
+        rating_frame.pack(fill="x")
+        ttk.Label(rating_frame, text="Rating (1-5):").pack(side="left")
+        self.rating_entry = ttk.Entry(rating_frame, width=6)
+        self.rating_entry.pack(side="left", padx=(6, 0))
+
+    def show(self, idx, block, placeholder=""):
+        """Load block (entry idx) read-only; None clears the row."""
+        self.idx = idx
+        self.block = block
+        parsed = parse_entry(block) if block is not None else None
+        self.dt_label.configure(
+            text=(parsed.get("datetime") or "") if parsed else "")
+        self.text_widget.configure(state=tk.NORMAL)
+        self.text_widget.delete("1.0", tk.END)
+        self.text_widget.insert(
+            tk.END, (parsed.get("text") or "") if parsed else placeholder)
+        self.text_widget.configure(state=tk.DISABLED)
+        self.rating_entry.configure(state=tk.NORMAL)
+        self.rating_entry.delete(0, tk.END)
+        if parsed:
+            self.rating_entry.insert(0, str(parsed.get("rating") or ""))
+        self.rating_entry.configure(state=tk.DISABLED)
+        self.edit_btn.configure(state=tk.NORMAL if parsed else tk.DISABLED)
+        self.del_btn.configure(state=tk.NORMAL if parsed else tk.DISABLED)
+        self.update_btn.configure(state=tk.DISABLED)
+
+    def on_edit(self):
+        self.text_widget.configure(state=tk.NORMAL)
+        self.rating_entry.configure(state=tk.NORMAL)
+        self.edit_btn.configure(state=tk.DISABLED)
+        self.update_btn.configure(state=tk.NORMAL)
+
+    def on_update(self):
+        if self.block is None:
+            return
+        new_text = self.text_widget.get("1.0", tk.END).strip()
+        rating_val = self.rating_entry.get().strip()
+        if rating_val:
+            if not rating_val.isdigit() or not (1 <= int(rating_val) <= 5):
+                messagebox.showerror(
+                    "Invalid rating", "Please enter rating between 1 and 5.")
+                return
+            rating_int = int(rating_val)
+        else:
+            rating_int = None
+        # Build new block: keep original datetime line from old block
+        parsed_old = parse_entry(self.block)
+        dt_line = f"🗓️ {parsed_old['datetime']}" if parsed_old[
+            'datetime'] else f"🗓️ {format_entry_datetime(datetime.datetime.now())}"
+        parts = [dt_line, new_text]
+        if rating_int is not None:
+            parts.append(f"Productivity Rating: {rating_int}/5")
+        new_block = "\n".join(parts) + "\n" + SEPARATOR + "\n"
+        try:
+            # idx may be stale after other deletes; the block text is checked too
+            replace_block_in_file(self.block, new_block, self.idx)
+            messagebox.showinfo(
+                "Updated", "Entry updated successfully.")
+            self.show(self.idx, parse_all(new_block)[0][0])
+            self.on_updated(self)
+        except Exception as e:
+            messagebox.showerror("Update failed", str(e))
+
+    def on_delete(self):
+        if self.block is None:
+            return
+        if not messagebox.askyesno("Confirm Delete", "Delete this entry?"):
+            return
+        try:
+            delete_block_from_file(self.block, self.idx)
+            messagebox.showinfo(
+                "Deleted", "Entry removed. A backup was created.")
+            self.on_deleted(self)
+        except Exception as e:
+            messagebox.showerror("Delete failed", str(e))
+
+
 class ViewAllFrame(ttk.Frame):
-    """Shows all entries; each entry has Edit, Update and Delete buttons."""
+    """Shows all entries in a list; the selected entry can be edited, updated or deleted."""
 
     def __init__(self, parent, controller):
         super().__init__(parent, style="TFrame")
         self.controller = controller
+        self.listed_blocks = []  # the blocks the tree's item ids index into
         self.create_ui()
 
     def restyle(self):
@@ -448,126 +1154,92 @@ class ViewAllFrame(ttk.Frame):
         title = ttk.Label(self, text="All Entries", style="Header.TLabel")
         title.pack(anchor="nw", pady=(6, 6), padx=pad)
 
-        self.container = ttk.Frame(self)
-        self.container.pack(fill="both", expand=True, padx=pad, pady=(6, 12))
-
         self.refresh_btn = ttk.Button(self, text="Refresh",
                                       command=self.refresh)
-        self.refresh_btn.pack(pady=(0, 6))
+        self.refresh_btn.pack(side="bottom", pady=(0, 6))
 
-    def refresh(self):
-        for child in self.container.winfo_children():
-            child.destroy()
+        # One list widget for all entries: Tk only draws the visible rows
+        self.container = ttk.Frame(self)
+        self.container.pack(fill="both", expand=True, padx=pad, pady=(6, 6))
+
+        self.tree = ttk.Treeview(self.container, columns=("dt", "rating", "preview"),
+                                 show="headings", selectmode="browse", height=8)
+        self.tree.heading("dt", text="Date")
+        self.tree.heading("rating", text="Rating")
+        self.tree.heading("preview", text="Entry")
+        self.tree.column("dt", width=180, stretch=False)
+        self.tree.column("rating", width=60, anchor="center", stretch=False)
+        self.tree.column("preview", width=400)
+        scroll = ttk.Scrollbar(self.container, orient="vertical",
+                               command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scroll.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scroll.pack(side="right", fill="y")
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+
+        # Detail pane for the selected entry
+        self.detail = EntryRow(self, self.on_updated, self.on_deleted,
+                               text_height=6)
+        self.detail.pack(fill="x", padx=pad, pady=(6, 12))
+        self.detail.show(None, None)
 
+    def refresh(self):
+        self.tree.delete(*self.tree.get_children())
         blocks = read_all_entries_raw()
-        if not blocks:
-            lab = ttk.Label(
-                self.container, text="No entries found. Add your first learning note!")
-            lab.pack(anchor="center", pady=20)
+        parsed_all = read_all_entries_parsed()
+        self.listed_blocks = list(blocks)
+        # newest first; the item id is the block's index in the journal
+        for i in range(len(blocks) - 1, -1, -1):
+            self.tree.insert("", tk.END, iid=str(i),
+                             values=self._row_values(parsed_all[i]))
+        if blocks:
+            self.detail.show(None, None)
+        else:
+            self.detail.show(
+                None, None, "No entries found. Add your first learning note!")
+
+    @staticmethod
+    def _row_values(parsed):
+        text = parsed.get("text") or ""
+        return (parsed.get("datetime") or "", parsed.get("rating") or "",
+                text.split("\n", 1)[0])
+
+    def on_select(self, event=None):
+        sel = self.tree.selection()
+        if not sel:
+            return
+        idx = int(sel[0])
+        blocks = read_all_entries_raw()
+        if idx >= len(blocks) or blocks[idx] != self.listed_blocks[idx]:
+            # the journal changed since the tree was listed, so the id may now
+            # point at another entry; re-list instead of editing the wrong one
+            self.refresh()
             return
+        self.detail.show(idx, blocks[idx])
 
-        # For each block show a framed row: datetime, editable Text, rating entry, buttons
-        for i, b in enumerate(blocks[::-1]):  # show newest first
-            parsed = parse_entry(b)
-            frame = ttk.Frame(self.container, style="Panel.TFrame", padding=8)
-            frame.pack(fill="x", pady=6)
-
-            top = ttk.Frame(frame)
-            top.pack(fill="x")
-            dt_label = ttk.Label(top, text=parsed.get(
-                "datetime") or "", font=("Segoe UI", 10, "bold"))
-            dt_label.pack(side="left")
-
-            btns = ttk.Frame(top)
-            btns.pack(side="right")
-
-            edit_btn = ttk.Button(btns, text="Edit")
-            update_btn = ttk.Button(btns, text="Update")
-            del_btn = ttk.Button(btns, text="Delete")
-
-            edit_btn.pack(side="left", padx=4)
-            update_btn.pack(side="left", padx=4)
-            del_btn.pack(side="left", padx=4)
-
-            # Text area
-            text_widget = scrolledtext.ScrolledText(
-                frame, height=5, wrap=tk.WORD)
-            text_widget.insert(tk.END, parsed.get("text") or "")
-            text_widget.configure(state=tk.DISABLED)
-            text_widget.pack(fill="both", padx=(0, 0), pady=(6, 6))
-
-            # Rating edit
-            rating_frame = ttk.Frame(frame)
-            rating_frame.pack(fill="x")
-            ttk.Label(rating_frame, text="Rating (1-5):").pack(side="left")
-            rating_var = tk.StringVar(value=str(parsed.get("rating") or ""))
-            rating_entry = ttk.Entry(
-                rating_frame, textvariable=rating_var, width=6)
-            rating_entry.pack(side="left", padx=(6, 0))
-            rating_entry.configure(state=tk.DISABLED)
-
-            # Wire up buttons
-            def on_edit(tw=text_widget, rv=rating_var, re=rating_entry, eb=edit_btn, ub=update_btn):
-                tw.configure(state=tk.NORMAL)
-                re.configure(state=tk.NORMAL)
-                eb.configure(state=tk.DISABLED)
-                ub.configure(state=tk.NORMAL)
-
-            def on_update(old_block=b, tw=text_widget, rv=rating_var, eb=edit_btn, ub=update_btn):
-                new_text = tw.get("1.0", tk.END).strip()
-                rating_val = rv.get().strip()
-                if rating_val:
-                    if not rating_val.isdigit() or not (1 <= int(rating_val) <= 5):
-                        messagebox.showerror(
-                            "Invalid rating", "Please enter rating between 1 and 5.")
-                        return
-                    rating_int = int(rating_val)
-                else:
-                    rating_int = None
-                # Build new block: keep original datetime line from old block
-                parsed_old = parse_entry(old_block)
-                dt_line = f"🗓️ {parsed_old['datetime']}" if parsed_old[
-                    'datetime'] else f"🗓️ {datetime.datetime.now().strftime(DATE_FORMAT)}"
-                parts = [dt_line, new_text]
-                if rating_int is not None:
-                    parts.append(f"Productivity Rating: {rating_int}/5")
-                new_block = "\n".join(parts) + "\n" + SEPARATOR + "\n"
-                try:
-                    replace_block_in_file(old_block, new_block)
-                    messagebox.showinfo(
-                        "Updated", "Entry updated successfully.")
-                    # disable editing controls
-                    tw.configure(state=tk.DISABLED)
-                    re.configure(state=tk.DISABLED)
-                    eb.configure(state=tk.NORMAL)
-                    ub.configure(state=tk.DISABLED)
-                    # refresh dashboard and other frames
-                    self.controller.refresh_dashboard()
-                except Exception as e:
-                    messagebox.showerror("Update failed", str(e))
-
-            def on_delete(old_block=b, container_frame=frame):
-                if not messagebox.askyesno("Confirm Delete", "Delete this entry?"):
-                    return
-                try:
-                    delete_block_from_file(old_block)
-                    messagebox.showinfo(
-                        "Deleted", "Entry removed. A backup was created.")
-                    container_frame.destroy()
-                    self.controller.refresh_dashboard()
-                except Exception as e:
-                    messagebox.showerror("Delete failed", str(e))
-
-            edit_btn.configure(command=on_edit)
-            update_btn.configure(command=on_update)
-            del_btn.configure(command=on_delete)
-            update_btn.configure(state=tk.DISABLED)
+    def on_updated(self, row):
+        idx = row.idx
+        # re-list in case the edited text changed the number of blocks
+        self.refresh()
+        if self.tree.exists(str(idx)):
+            self.tree.selection_set(str(idx))
+            self.tree.see(str(idx))
+        # refresh dashboard and other frames
+        self.controller.refresh_dashboard()
+
+    def on_deleted(self, row):
+        # indices after the deleted one have shifted, so re-list
+        self.refresh()
+        self.controller.refresh_dashboard()
 
 
 class SearchFrame(ttk.Frame):
+    ROW_POOL_SIZE = 10  # result rows kept for reuse; rows beyond this are destroyed
+
     def __init__(self, parent, controller):
         super().__init__(parent, style="TFrame")
         self.controller = controller
+        self.row_pool = []  # EntryRows kept across searches and reused
         self.create_ui()
 
     def restyle(self):
@@ -590,6 +1262,8 @@ class SearchFrame(ttk.Frame):
         self.results_container = ttk.Frame(self)
         self.results_container.pack(
             fill="both", expand=True, padx=pad, pady=(6, 12))
+        self.no_match_lbl = ttk.Label(
+            self.results_container, text="No matches found.")
 
         ttk.Button(self, text="Clear",
                    command=self.clear_results).pack(pady=(0, 12))
@@ -601,129 +1275,68 @@ class SearchFrame(ttk.Frame):
                 "Enter query", "Please enter a keyword or date to search.")
             return
         blocks = read_all_entries_raw()
-        matches = [b for b in blocks if q in b.lower()]
+        matches = [(i, blocks[i]) for i in search_entries(q)]
 
-        for child in self.results_container.winfo_children():
-            child.destroy()
+        self.hide_results()
 
         if not matches:
-            lab = ttk.Label(self.results_container, text="No matches found.")
-            lab.pack(anchor="center", pady=20)
+            self.no_match_lbl.pack(anchor="center", pady=20)
             return
 
-        # show matches with Edit/Update/Delete similar to ViewAllFrame
-        for b in matches[::-1]:
-            parsed = parse_entry(b)
-            frame = ttk.Frame(self.results_container,
-                              style="Panel.TFrame", padding=8)
-            frame.pack(fill="x", pady=6)
-
-            top = ttk.Frame(frame)
-            top.pack(fill="x")
-            dt_label = ttk.Label(top, text=parsed.get(
-                "datetime") or "", font=("Segoe UI", 10, "bold"))
-            dt_label.pack(side="left")
-
-            btns = ttk.Frame(top)
-            btns.pack(side="right")
-
-            edit_btn = ttk.Button(btns, text="Edit")
-            update_btn = ttk.Button(btns, text="Update")
-            del_btn = ttk.Button(btns, text="Delete")
-
-            edit_btn.pack(side="left", padx=4)
-            update_btn.pack(side="left", padx=4)
-            del_btn.pack(side="left", padx=4)
-
-            text_widget = scrolledtext.ScrolledText(
-                frame, height=5, wrap=tk.WORD)
-            text_widget.insert(tk.END, parsed.get("text") or "")
-            text_widget.configure(state=tk.DISABLED)
-            text_widget.pack(fill="both", padx=(0, 0), pady=(6, 6))
-
-            rating_frame = ttk.Frame(frame)
-            rating_frame.pack(fill="x")
-            ttk.Label(rating_frame, text="Rating (1-5):").pack(side="left")
-            rating_var = tk.StringVar(value=str(parsed.get("rating") or ""))
-            rating_entry = ttk.Entry(
-                rating_frame, textvariable=rating_var, width=6)
-            rating_entry.pack(side="left", padx=(6, 0))
-            rating_entry.configure(state=tk.DISABLED)
-
-            def on_edit(tw=text_widget, re=rating_entry, eb=edit_btn, ub=update_btn):
-                tw.configure(state=tk.NORMAL)
-                re.configure(state=tk.NORMAL)
-                eb.configure(state=tk.DISABLED)
-                ub.configure(state=tk.NORMAL)
-
-            def on_update(old_block=b, tw=text_widget, rv=rating_var, eb=edit_btn, ub=update_btn):
-                new_text = tw.get("1.0", tk.END).strip()
-                rating_val = rv.get().strip()
-                if rating_val:
-                    if not rating_val.isdigit() or not (1 <= int(rating_val) <= 5):
-                        messagebox.showerror(
-                            "Invalid rating", "Please enter rating between 1 and 5.")
-                        return
-                    rating_int = int(rating_val)
-                else:
-                    rating_int = None
-                parsed_old = parse_entry(old_block)
-                dt_line = f"🗓️ {parsed_old['datetime']}" if parsed_old[
-                    'datetime'] else f"🗓️ {datetime.datetime.now().strftime(DATE_FORMAT)}"
-                parts = [dt_line, new_text]
-                if rating_int is not None:
-                    parts.append(f"Productivity Rating: {rating_int}/5")
-                new_block = "\n".join(parts) + "\n" + SEPARATOR + "\n"
-                try:
-                    replace_block_in_file(old_block, new_block)
-                    messagebox.showinfo(
-                        "Updated", "Entry updated successfully.")
-                    tw.configure(state=tk.DISABLED)
-                    re.configure(state=tk.DISABLED)
-                    eb.configure(state=tk.NORMAL)
-                    ub.configure(state=tk.DISABLED)
-                    self.controller.refresh_dashboard()
-                except Exception as e:
-                    messagebox.showerror("Update failed", str(e))
-
-            def on_delete(old_block=b, container_frame=frame):
-                if not messagebox.askyesno("Confirm Delete", "Delete this entry?"):
-                    return
-                try:
-                    delete_block_from_file(old_block)
-                    messagebox.showinfo(
-                        "Deleted", "Entry removed. A backup was created.")
-                    container_frame.destroy()
-                    self.controller.refresh_dashboard()
-                except Exception as e:
-                    messagebox.showerror("Delete failed", str(e))
-
-            edit_btn.configure(command=on_edit)
-            update_btn.configure(command=on_update)
-            del_btn.configure(command=on_delete)
-            update_btn.configure(state=tk.DISABLED)
+        # show matches with Edit/Update/Delete like the ViewAllFrame detail pane;
+        # rows from earlier searches are refilled, new ones only made when short
+        while len(self.row_pool) < len(matches):
+            self.row_pool.append(EntryRow(self.results_container,
+                                          self.on_updated, self.on_deleted))
+        for row, (i, b) in zip(self.row_pool, matches[::-1]):
+            row.show(i, b)
+            row.pack(fill="x", pady=6)
+
+    def on_updated(self, row):
+        self.controller.refresh_dashboard()
+
+    def on_deleted(self, row):
+        row.pack_forget()
+        self.controller.refresh_dashboard()
+
+    def hide_results(self):
+        for child in self.results_container.pack_slaves():
+            child.pack_forget()
+        # don't let one broad search pin a widget set per match forever
+        for row in self.row_pool[self.ROW_POOL_SIZE:]:
+            row.destroy()
+        del self.row_pool[self.ROW_POOL_SIZE:]
 
     def clear_results(self):
         self.qvar.set("")
-        for child in self.results_container.winfo_children():
-            child.destroy()
+        self.hide_results()
 
 
 class CalendarFrame(ttk.Frame):
     """A very simple calendar view implemented with stdlib calendar module.
     Dates that have entries are emphasized; clicking a date shows entries for that date.
+    The month grid is drawn on a single Canvas rather than one widget per day.
     """
 
+    CELL_W = 44
+    CELL_H = 30
+
     def __init__(self, parent, controller):
         super().__init__(parent, style="TFrame")
         self.controller = controller
         self.today = datetime.date.today()
         self.current_year = self.today.year
         self.current_month = self.today.month
+        self.month_dates = ()
+        self.drawn_month = None  # the month self.month_dates / the canvas show
+        self._reload = None  # pending background read of the journal
+        self._refresh_job = None  # pending after() id of a navigation redraw
         self.create_ui()
 
     def restyle(self):
         self.configure(style="TFrame")
+        # the canvas isn't a ttk widget, so redraw it with the new colors
+        self.refresh()
 
     def create_ui(self):
         pad = 8
@@ -740,86 +1353,114 @@ class CalendarFrame(ttk.Frame):
         self.month_label = ttk.Label(nav, text="")
         self.month_label.pack(side="right")
 
-        self.cal_frame = ttk.Frame(self)
-        self.cal_frame.pack(fill="both", expand=False, padx=pad, pady=(6, 12))
-
-        self.entries_box = scrolledtext.ScrolledText(self, height=12)
+        # header row + up to 6 weeks
+        self.canvas = tk.Canvas(self, width=7 * self.CELL_W, height=7 * self.CELL_H,
+                                highlightthickness=0)
+        self.canvas.pack(anchor="w", padx=pad, pady=(6, 12))
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+        # the canvas items are created once; refresh() only reconfigures them
+        cw, ch = self.CELL_W, self.CELL_H
+        self.header_items = [
+            self.canvas.create_text(col * cw + cw // 2, ch // 2, text=wd)
+            for col, wd in enumerate(_WEEKDAYS)]
+        self.cell_items = []
+        for i in range(42):
+            row, col = divmod(i, 7)
+            x0, y0 = col * cw, (row + 1) * ch
+            self.cell_items.append((
+                self.canvas.create_rectangle(x0 + 2, y0 + 2, x0 + cw - 2, y0 + ch - 2),
+                self.canvas.create_text(x0 + cw // 2, y0 + ch // 2)))
+
+        # read-only view that is replaced wholesale, so it needs no undo history
+        self.entries_box = scrolledtext.ScrolledText(
+            self, height=12, undo=False, autoseparators=False, maxundo=0)
         self.entries_box.pack(fill="both", expand=True, padx=pad, pady=(6, 12))
         self.entries_box.configure(state=tk.DISABLED)
 
-        self.refresh()
+        self.draw_month()
 
     def refresh(self):
-        # Build map of dates that have entries
-        blocks = read_all_entries_raw()
-        date_map = {}
-        for b in blocks:
-            p = parse_entry(b)
-            dt = p.get("datetime")
-            if dt:
-                # assume format starts with YYYY-MM-DD
-                try:
-                    date_key = dt.strip()[:10]
-                except Exception:
-                    continue
-                date_map.setdefault(date_key, []).append(p)
+        if entries_are_cached():
+            self.draw_month()
+            return
+        # cold cache (first open or the file changed on disk): read it off the Tk thread
+        self.month_label.configure(text="Loading…")
+        if self._reload is None:
+            self._reload = self.controller.executor.submit(read_journal_snapshot)
+            self.after(50, self._poll_reload)
+
+    def _poll_reload(self):
+        if not self._reload.done():
+            self.after(50, self._poll_reload)
+            return
+        future, self._reload = self._reload, None
+        if future.exception() is None:
+            install_journal_snapshot(future.result())
+        # if the file changed again meanwhile, this reads it synchronously
+        self.draw_month()
 
-        # render month
-        for child in self.cal_frame.winfo_children():
-            child.destroy()
+    def draw_month(self):
+        # dates that have entries
+        date_map = get_entries_by_date()
+        c = self.controller.dark_colors if self.controller.dark_mode else self.controller.light_colors
 
         year = self.current_year
         month = self.current_month
-        month_name = calendar.month_name[month]
-        self.month_label.configure(text=f"{month_name} {year}")
-
-        week_days = ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]
-        header_row = ttk.Frame(self.cal_frame)
-        header_row.pack()
-        for wd in week_days:
-            ttk.Label(header_row, text=wd, width=4).pack(side="left")
-
-        cal = calendar.Calendar(firstweekday=0)
-        month_days = cal.monthdayscalendar(year, month)
-
-        for week in month_days:
-            row = ttk.Frame(self.cal_frame)
-            row.pack()
-            for d in week:
-                if d == 0:
-                    ttk.Label(row, text=" ", width=4).pack(side="left")
-                else:
-                    date_str = f"{year}-{month:02d}-{d:02d}"
-                    btn = ttk.Button(row, text=str(d), width=4,
-                                     command=lambda ds=date_str: self.show_entries_for_date(ds))
-                    # highlight if date has entries
-                    if date_str in date_map:
-                        # decorate the button label with an asterisk
-                        btn.config(text=f"{d}*")
-                    btn.pack(side="left")
-
-    def show_entries_for_date(self, date_str):
-        # date_str like YYYY-MM-DD
-        blocks = read_all_entries_raw()
-        matches = []
-        for b in blocks:
-            if date_str in b:
-                matches.append(b)
-        self.entries_box.configure(state=tk.NORMAL)
-        self.entries_box.delete("1.0", tk.END)
+        self.month_label.configure(text=f"{_MONTH_NAMES[month]} {year}")
+
+        # render month
+        canvas = self.canvas
+        canvas.configure(bg=c["bg"])
+        for item in self.header_items:
+            canvas.itemconfigure(item, fill=c["fg"])
+
+        # whole weeks of date objects; each cell is one lookup in date_map
+        self.month_dates = month_dates(year, month)
+        self.drawn_month = month
+
+        for i, (rect, label) in enumerate(self.cell_items):
+            day = self.month_dates[i] if i < len(self.month_dates) else None
+            if day is None or day.month != month:
+                canvas.itemconfigure(rect, state="hidden")
+                canvas.itemconfigure(label, state="hidden")
+                continue
+            has_entries = day in date_map
+            canvas.itemconfigure(rect, state="normal", outline=c["bg"],
+                                 fill=c["accent"] if has_entries else c["panel"])
+            canvas.itemconfigure(label, state="normal", fill=c["fg"],
+                                 text=(_MARKED_DAY_LABELS if has_entries else _DAY_LABELS)[day.day])
+
+    def on_canvas_click(self, event):
+        # map the click to a (row, col) cell and from there to a date
+        row = event.y // self.CELL_H - 1
+        col = event.x // self.CELL_W
+        i = row * 7 + col
+        if row < 0 or not (0 <= col < 7) or i >= len(self.month_dates):
+            return
+        day = self.month_dates[i]
+        # compare with the month on screen: current_month runs ahead of it
+        # while a redraw is pending or the journal is loading
+        if day.month == self.drawn_month:
+            self.show_entries_for_date(day)
+
+    def show_entries_for_date(self, day):
+        # day is a datetime.date, the key of the date map refresh() marks the days with
+        matches = get_entries_on(day)
         if not matches:
-            self.entries_box.insert(tk.END, "No entries for this date.")
+            content = "No entries for this date."
         else:
-            for m in matches:
-                parsed = parse_entry(m)
-                self.entries_box.insert(
-                    tk.END, f"{parsed.get('datetime') or ''}\n")
-                self.entries_box.insert(
-                    tk.END, f"{parsed.get('text') or ''}\n")
+            # build the whole text first: one insert instead of several per entry
+            parts = []
+            for parsed in matches:
+                parts.append(f"{parsed.get('datetime') or ''}\n{parsed.get('text') or ''}\n")
                 if parsed.get('rating') is not None:
-                    self.entries_box.insert(
-                        tk.END, f"Rating: {parsed.get('rating')}/5\n")
-                self.entries_box.insert(tk.END, SEPARATOR + "\n")
+                    parts.append(f"Rating: {parsed.get('rating')}/5\n")
+                parts.append(SEPARATOR + "\n")
+            content = "".join(parts)
+        self.entries_box.configure(state=tk.NORMAL)
+        self.entries_box.delete("1.0", tk.END)
+        self.entries_box.insert(tk.END, content)
+        self.entries_box.yview_moveto(0.0)
         self.entries_box.configure(state=tk.DISABLED)
 
     def prev_month(self):
@@ -828,7 +1469,7 @@ class CalendarFrame(ttk.Frame):
             self.current_year -= 1
         else:
             self.current_month -= 1
-        self.refresh()
+        self.schedule_refresh()
 
     def next_month(self):
         if self.current_month == 12:
@@ -836,12 +1477,22 @@ class CalendarFrame(ttk.Frame):
             self.current_year += 1
         else:
             self.current_month += 1
-        self.refresh()
+        self.schedule_refresh()
 
     def go_today(self):
         self.today = datetime.date.today()
         self.current_year = self.today.year
         self.current_month = self.today.month
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        # rapid Prev/Next clicks collapse into a single redraw of the last month
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(16, self._scheduled_refresh)
+
+    def _scheduled_refresh(self):
+        self._refresh_job = None
         self.refresh()
 
 